@@ -1,20 +1,598 @@
 import sys
 import os
+import csv
+import math
+import time
+import heapq
+import json
+import re
+from itertools import islice
+from collections import OrderedDict, deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 import fitz # PyMuPDF 라이브러리 임포트
 from PyPDF2 import PdfReader, PdfWriter, PdfMerger
 
 from PyQt6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QMessageBox,
     QFileDialog, QInputDialog, QLineEdit, QStackedWidget, QScrollArea, QLabel,
-    QSizePolicy, QFrame, QGridLayout, QProgressBar, QStatusBar
+    QSizePolicy, QFrame, QGridLayout, QProgressBar, QStatusBar, QTabBar
 )
-from PyQt6.QtCore import Qt, QSize, QDir
+from PyQt6.QtCore import Qt, QSize, QDir, pyqtSignal
+from PyQt6.QtGui import QImage, QPixmap
+
+PREVIEW_ZOOM = 0.8 # 미리보기 렌더링 배율
+MAX_OPEN_DOCUMENTS = 8 # 동시에 열어 둘 fitz.Document 핸들 수
+BACKGROUND_PREFETCH_PAGES = 3 # 비활성 탭에서 미리 렌더링할 페이지 수
+PREVIEW_RENDER_WORKERS = 2 # 미리보기 렌더링 프로세스 수 (GUI 스레드를 막지 않도록 별도 프로세스에서 렌더링)
+PREVIEW_WINDOW_PAGES = 20 # 화면에 보이는 페이지 앞뒤로 렌더링해 둘 페이지 수
+PREVIEW_CACHE_MAX_BYTES = 256 * 1024 * 1024 # 모든 탭의 렌더링된 미리보기 이미지에 쓸 최대 메모리
+TEXT_EXPORT_CHUNK_PAGES = 32 # 텍스트 추출 묶음 크기 기본값 (실행 계획이 페이지 수에 맞춰 조정)
+INVENTORY_CHUNK_FILES = 64 # 목록 검사 워커 한 작업당 파일 수
+INVENTORY_IN_PROCESS_FILES = 16 # 검사할 파일이 이 수 이하이면 프로세스 풀 없이 처리 (예: 합치기 전 사전 검사)
+APP_DATA_DIR = os.path.join(os.path.expanduser("~"), ".pdf_manager") # 캐시 등 앱 데이터 저장 위치
+INVENTORY_CACHE_PATH = os.path.join(APP_DATA_DIR, "inventory_cache.json")
+INVENTORY_FIELDS = ["path", "size", "pages", "version", "encrypted", "producer", "status", "error"]
+IMAGE_EXPORT_FORMATS = {"PNG": "png", "JPEG": "jpg", "TIFF": "tif"} # 이미지 형식 -> 확장자
+JPEG_QUALITY = 90
+IMAGE_EXPORT_MAX_PIXMAP_BYTES = 1024 * 1024 * 1024 # 이미지 내보내기에서 동시에 렌더링 중인 픽스맵에 쓸 최대 메모리
+ESTIMATOR_HISTORY_PATH = os.path.join(APP_DATA_DIR, "job_estimates.json")
+PLANNER_SAMPLE_FILES = 8 # 비용 추정 시 열어 볼 최대 파일 수
+PLANNER_SAMPLE_PAGES = 4 # 파일당 이미지 밀도를 확인할 최대 페이지 수
+IN_PROCESS_MAX_SECONDS = 2.0 # 예상 시간이 이보다 짧으면 프로세스 풀 없이 처리
+POOL_STARTUP_SECONDS = 0.5 # 프로세스 풀 시작 비용 (추정치)
+CONFIRM_MIN_SECONDS = 30.0 # 예상 시간이 이보다 길면 작업 시작 전에 확인
+
+# 작업 종류별 단일 프로세스 기준 기본 비용 (초): 페이지당, MB당, 이미지당
+DEFAULT_JOB_COSTS = {
+    "merge": {"page": 0.002, "mb": 0.02, "image": 0.0},
+    "preview": {"page": 0.02, "mb": 0.0, "image": 0.01},
+    "text": {"page": 0.01, "mb": 0.0, "image": 0.0},
+    "images": {"page": 0.15, "mb": 0.0, "image": 0.02},
+}
+
+# 텍스트 추출 형식: (선택 목록 이름, 형식 키, 기본 파일명, 파일 필터)
+TEXT_EXPORT_FORMATS = [
+    ("일반 텍스트 (.txt)", "txt", "extracted_text.txt", "텍스트 파일 (*.txt);;모든 파일 (*)"),
+    ("페이지별 JSONL (.jsonl)", "pages_jsonl", "extracted_pages.jsonl", "JSON Lines 파일 (*.jsonl);;모든 파일 (*)"),
+    ("블록별 JSONL + 좌표 (.jsonl)", "blocks_jsonl", "extracted_blocks.jsonl", "JSON Lines 파일 (*.jsonl);;모든 파일 (*)"),
+    ("Markdown (.md)", "markdown", "extracted_text.md", "Markdown 파일 (*.md);;모든 파일 (*)"),
+]
+
+
+def iter_pool_results(func, tasks, max_workers=None, initializer=None, initargs=()):
+    """
+    작업들을 프로세스 풀에서 실행하고 결과를 입력 순서대로 하나씩 반환합니다.
+    동시에 처리 중인 작업 수를 워커 수의 2배로 제한하여 결과가 메모리에 쌓이지 않게 합니다.
+    initializer는 워커 프로세스마다 한 번 호출됩니다 (예: 워커별 문서 열기).
+    max_workers가 1이면 프로세스 풀을 만들지 않고 현재 프로세스에서 순서대로 실행하며,
+    이때 initializer가 정리 함수를 반환하면 작업이 끝난 뒤 호출합니다.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    if max_workers == 1:
+        # 작은 작업은 프로세스 풀 시작 비용 없이 현재 프로세스에서 바로 처리
+        cleanup = initializer(*initargs) if initializer is not None else None
+        try:
+            for task in tasks:
+                yield func(task)
+        finally:
+            if callable(cleanup):
+                cleanup() # GUI 프로세스에 워커용 자원(예: 열린 문서)이 남지 않게 정리
+        return
+    tasks = iter(tasks)
+    executor = ProcessPoolExecutor(max_workers=max_workers, initializer=initializer, initargs=initargs)
+    try:
+        pending = deque(executor.submit(func, task) for task in islice(tasks, max_workers * 2))
+        while pending:
+            result = pending.popleft().result()
+            for task in islice(tasks, 1):
+                pending.append(executor.submit(func, task))
+            yield result
+    finally:
+        executor.shutdown(cancel_futures=True)
+
+
+def _format_page_text(page, page_index, export_format):
+    """PyMuPDF 페이지 하나를 지정한 형식의 문자열로 변환합니다."""
+    if export_format == "pages_jsonl":
+        record = {
+            "page": page_index + 1,
+            "width": round(page.rect.width, 2),
+            "height": round(page.rect.height, 2),
+            "text": page.get_text("text", sort=True),
+        }
+        return json.dumps(record, ensure_ascii=False) + "\n"
+
+    if export_format == "blocks_jsonl":
+        lines = []
+        for block in page.get_text("dict", sort=True)["blocks"]:
+            if block["type"] != 0: # 이미지 블록은 제외
+                continue
+            spans = [span for line in block["lines"] for span in line["spans"]]
+            text = "\n".join("".join(span["text"] for span in line["spans"]) for line in block["lines"])
+            if not text.strip():
+                continue
+            record = {
+                "page": page_index + 1,
+                "block": block["number"],
+                "bbox": [round(v, 2) for v in block["bbox"]],
+                "font_size": round(max(span["size"] for span in spans), 2),
+                "text": text,
+            }
+            lines.append(json.dumps(record, ensure_ascii=False) + "\n")
+        return "".join(lines)
+
+    if export_format == "markdown":
+        paragraphs = []
+        for block in page.get_text("blocks", sort=True):
+            if block[6] != 0: # 이미지 블록은 제외
+                continue
+            paragraph = " ".join(block[4].split())
+            if paragraph:
+                paragraphs.append(paragraph)
+        return f"## Page {page_index + 1}\n\n" + "".join(p + "\n\n" for p in paragraphs)
+
+    raise ValueError(f"알 수 없는 텍스트 추출 형식: {export_format}")
+
+
+def _extract_text_chunk(task):
+    """
+    프로세스 풀 워커: 페이지 범위 [start, end)의 텍스트를 지정 형식으로 추출해 하나의 문자열로 반환합니다.
+    """
+    pdf_path, start, end, export_format = task
+    if export_format == "txt":
+        # 일반 텍스트는 기존과 같은 결과가 나오도록 PyPDF2로 추출 (파일 객체를 넘겨 필요한 부분만 읽음)
+        with open(pdf_path, 'rb') as pdf_file:
+            reader = PdfReader(pdf_file)
+            return "".join(reader.pages[i].extract_text() + "\n" for i in range(start, end))
+
+    with fitz.open(pdf_path) as doc:
+        return "".join(_format_page_text(doc[i], i, export_format) for i in range(start, end))
+
+
+def _read_pdf_header_version(path):
+    """파일 앞부분의 %PDF-x.y 헤더에서 PDF 버전을 읽습니다. 암호화된 파일처럼 메타데이터가 없을 때 사용합니다."""
+    with open(path, 'rb') as pdf_file:
+        match = re.search(rb"%PDF-(\d+\.\d+)", pdf_file.read(1024)) # 헤더 앞에 쓰레기 바이트가 있는 파일도 허용
+    return match.group(1).decode("ascii") if match else ""
+
+
+def _scan_pdf_metadata(path):
+    """
+    PDF 파일 하나의 메타데이터를 읽습니다. 페이지 내용은 읽지 않고 헤더, 트레일러, xref, Info 사전만 사용합니다.
+    status는 "ok", "encrypted"(암호 필요), "repaired"(xref 손상으로 복구됨), "error"(열 수 없음) 중 하나입니다.
+    """
+    info = {
+        "path": path, "size": None, "mtime": None, "pages": None, "version": "",
+        "encrypted": False, "producer": "", "status": "ok", "error": "",
+    }
+    try:
+        stat = os.stat(path) # 검색 후 삭제된 파일도 오류로 기록
+        info["size"] = stat.st_size
+        info["mtime"] = stat.st_mtime
+        with fitz.open(path, filetype="pdf") as doc:
+            metadata = doc.metadata or {}
+            info["version"] = (metadata.get("format") or "").replace("PDF", "").strip() or _read_pdf_header_version(path)
+            info["encrypted"] = bool(metadata.get("encryption") or doc.needs_pass)
+            if doc.needs_pass:
+                info["status"] = "encrypted" # 암호 없이는 페이지 트리를 읽을 수 없음
+                return info
+            info["pages"] = doc.page_count
+            info["producer"] = metadata.get("producer") or ""
+            if doc.is_repaired:
+                info["status"] = "repaired"
+    except Exception as e:
+        info["status"] = "error"
+        info["error"] = str(e)
+    return info
+
+
+def _scan_pdf_chunk(paths):
+    """프로세스 풀 워커: 파일 묶음의 메타데이터를 읽어 리스트로 반환합니다."""
+    return [_scan_pdf_metadata(path) for path in paths]
+
+
+def _iter_scan_chunks(chunks, max_workers=None):
+    """
+    파일 묶음들을 프로세스 풀에서 검사하여 묶음별 결과를 입력 순서대로 반환합니다.
+    MuPDF 비정상 종료로 풀이 깨지면 결과를 받지 못한 첫 묶음만 파일별로 다시 검사하고,
+    나머지 묶음은 새 프로세스 풀에서 계속 검사합니다.
+    """
+    remaining = deque(chunks)
+    while remaining:
+        try:
+            for chunk_records in iter_pool_results(_scan_pdf_chunk, list(remaining), max_workers=max_workers):
+                remaining.popleft()
+                yield chunk_records
+        except BrokenProcessPool:
+            yield list(_iter_scan_isolated(remaining.popleft()))
+
+
+def _iter_scan_isolated(paths):
+    """
+    파일을 하나씩 별도 프로세스에서 검사하여 결과를 반환합니다.
+    MuPDF가 비정상 종료되는 파일은 status="error"로 기록하고 새 프로세스로 나머지 파일을 계속 검사합니다.
+    """
+    executor = None
+    try:
+        for path in paths:
+            if executor is None:
+                executor = ProcessPoolExecutor(max_workers=1)
+            try:
+                yield executor.submit(_scan_pdf_metadata, path).result()
+            except BrokenProcessPool:
+                executor.shutdown(cancel_futures=True)
+                executor = None
+                info = {
+                    "path": path, "size": None, "mtime": None, "pages": None, "version": "",
+                    "encrypted": False, "producer": "", "status": "error",
+                    "error": "PDF를 검사하는 중 프로세스가 비정상 종료되었습니다.",
+                }
+                try:
+                    stat = os.stat(path) # 캐시에 남겨 다음 검사에서 다시 열지 않음
+                    info["size"] = stat.st_size
+                    info["mtime"] = stat.st_mtime
+                except OSError:
+                    pass
+                yield info
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
+
+
+_preview_worker_docs = OrderedDict() # 미리보기 렌더링 프로세스가 열어 둔 문서: 경로 -> (fitz.Document, 파일 시그니처)
+
+
+def _render_preview_page(task):
+    """
+    미리보기 렌더링 프로세스 워커: 페이지 하나를 렌더링하여 (너비, 높이, stride, 픽셀 바이트)를 반환합니다.
+    워커마다 자신의 fitz.Document를 열어 두고 재사용합니다. 요청 이후 파일이 바뀌었으면 None을 반환합니다.
+    """
+    pdf_path, signature, page_index, zoom = task
+    if _file_signature(pdf_path) != signature:
+        return None
+    entry = _preview_worker_docs.get(pdf_path)
+    if entry is None or entry[1] != signature:
+        if entry is not None:
+            entry[0].close()
+        entry = (fitz.open(pdf_path), signature)
+        _preview_worker_docs[pdf_path] = entry
+    _preview_worker_docs.move_to_end(pdf_path)
+    while len(_preview_worker_docs) > MAX_OPEN_DOCUMENTS:
+        _, (doc, _) = _preview_worker_docs.popitem(last=False)
+        doc.close()
+    pix = entry[0][page_index].get_pixmap(matrix=fitz.Matrix(zoom, zoom), alpha=False)
+    return pix.width, pix.height, pix.stride, pix.samples
+
+
+_worker_doc = None # 이미지 내보내기 워커 프로세스가 열어 두는 문서
+
+
+def _init_render_worker(pdf_path):
+    """
+    프로세스 풀 워커 초기화: 워커마다 문서를 한 번만 엽니다.
+    현재 프로세스에서 실행할 때 호출할 정리 함수를 반환합니다.
+    """
+    global _worker_doc
+    _worker_doc = fitz.open(pdf_path)
+    return _close_render_worker
+
+
+def _close_render_worker():
+    """워커용 문서를 닫습니다 (Windows에서 원본 파일이 잠긴 채로 남지 않도록)."""
+    global _worker_doc
+    if _worker_doc is not None:
+        _worker_doc.close()
+        _worker_doc = None
+
+
+def _render_page_image(task):
+    """
+    프로세스 풀 워커: 페이지 하나를 렌더링하고 인코딩하여 바로 파일로 저장합니다.
+    픽스맵은 워커 안에서만 사용하고, 메인 프로세스에는 페이지 번호와 파일 크기만 반환합니다.
+    """
+    page_index, output_path, image_format, dpi, width, grayscale = task
+    page = _worker_doc[page_index]
+    zoom = width / page.rect.width if width else dpi / 72 # 고정 너비가 지정되면 DPI 대신 사용
+    colorspace = fitz.csGRAY if grayscale else fitz.csRGB
+    pix = page.get_pixmap(matrix=fitz.Matrix(zoom, zoom), colorspace=colorspace, alpha=False)
+    effective_dpi = round(zoom * 72) # 고정 너비일 때 실제 물리 크기가 맞도록 실제 해상도를 기록
+    pix.set_dpi(effective_dpi, effective_dpi)
+    if image_format == "TIFF":
+        pix.pil_save(output_path, format="TIFF", dpi=(effective_dpi, effective_dpi), compression="tiff_lzw") # Pillow 필요
+    elif image_format == "JPEG":
+        pix.save(output_path, output="jpeg", jpg_quality=JPEG_QUALITY)
+    else:
+        pix.save(output_path, output="png")
+    return page_index, os.path.getsize(output_path)
+
+
+def _load_app_data(path):
+    """앱 데이터 JSON 파일(캐시, 추정 기록 등)을 읽습니다. 없거나 손상되었으면 빈 사전을 반환합니다."""
+    try:
+        with open(path, 'r', encoding='utf-8') as data_file:
+            return json.load(data_file)
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_app_data(path, data):
+    """앱 데이터 JSON 파일을 저장합니다. 저장에 실패해도 작업 결과에는 영향이 없습니다."""
+    try:
+        os.makedirs(APP_DATA_DIR, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as data_file:
+            json.dump(data, data_file, ensure_ascii=False)
+    except OSError:
+        pass
+
+
+def _write_inventory_report(records, save_path):
+    """목록 검사 결과를 확장자에 따라 CSV 또는 JSON 파일로 저장합니다."""
+    if save_path.lower().endswith('.json'):
+        with open(save_path, 'w', encoding='utf-8') as report_file:
+            json.dump([{field: record[field] for field in INVENTORY_FIELDS} for record in records],
+                      report_file, ensure_ascii=False, indent=2)
+    else:
+        # utf-8-sig: Excel에서 한글 경로가 깨지지 않도록 BOM 포함
+        with open(save_path, 'w', encoding='utf-8-sig', newline='') as report_file:
+            writer = csv.DictWriter(report_file, fieldnames=INVENTORY_FIELDS, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(records)
+
+
+def _file_signature(path):
+    """파일이 바뀌었는지 확인하기 위한 (수정 시각, 크기)를 반환합니다."""
+    stat = os.stat(path)
+    return stat.st_mtime, stat.st_size
+
+
+class DocumentPool:
+    """
+    열린 fitz.Document 핸들을 LRU 방식으로 관리합니다.
+    최대 개수를 넘으면 가장 오래 사용하지 않은 문서를 닫고, 닫힌 문서를 다시 요청하면 자동으로 다시 엽니다.
+    파일이 디스크에서 바뀌었으면 (수정 시각 또는 크기가 다르면) 기존 핸들을 닫고 다시 엽니다.
+    """
+    def __init__(self, max_open=MAX_OPEN_DOCUMENTS):
+        self.max_open = max_open
+        self._docs = OrderedDict() # 경로 -> (fitz.Document, 파일 시그니처) (오래된 순)
+
+    def __contains__(self, path):
+        return path in self._docs
+
+    def get(self, path):
+        """경로에 해당하는 문서를 반환합니다. 풀에 없거나 파일이 바뀌었으면 새로 엽니다."""
+        signature = _file_signature(path)
+        entry = self._docs.get(path)
+        if entry is None or entry[0].is_closed or entry[1] != signature:
+            self.release(path)
+            self._docs[path] = (fitz.open(path), signature)
+        self._docs.move_to_end(path) # 최근 사용으로 표시
+        self._evict()
+        return self._docs[path][0]
+
+    def signature(self, path):
+        """풀에 열린 문서를 열 때의 파일 시그니처를 반환합니다. 풀에 없으면 None입니다."""
+        entry = self._docs.get(path)
+        return entry[1] if entry else None
+
+    def release(self, path):
+        """문서를 풀에서 제거하고 닫습니다."""
+        entry = self._docs.pop(path, None)
+        if entry is not None and not entry[0].is_closed:
+            entry[0].close()
+
+    def close_all(self):
+        """풀에 있는 모든 문서를 닫습니다."""
+        for path in list(self._docs):
+            self.release(path)
+
+    def _evict(self):
+        while len(self._docs) > self.max_open:
+            _, (doc, _) = self._docs.popitem(last=False)
+            if not doc.is_closed:
+                doc.close()
+
+
+class JobPlanner:
+    """
+    작업을 시작하기 전에 입력 파일의 크기, 페이지 수, 이미지 밀도를 샘플링하여 소요 시간을 추정하고
+    실행 전략(현재 프로세스/프로세스 풀, PDF 엔진, 묶음 크기, 미리보기 해상도)을 정합니다.
+    작업이 끝나면 실제 소요 시간으로 작업 종류별 보정 계수를 갱신합니다.
+    """
+    def __init__(self):
+        self.history = _load_app_data(ESTIMATOR_HISTORY_PATH) # 작업 종류 -> {"factor", "runs"}
+
+    def sample_inputs(self, paths):
+        """
+        입력 파일을 샘플링합니다. 크기는 모든 파일에서, 페이지 수와 이미지 밀도는 일부 파일에서만 읽고
+        나머지 파일의 페이지 수는 크기 비율로 추정합니다.
+        """
+        sizes = []
+        for path in paths:
+            try:
+                sizes.append(os.path.getsize(path))
+            except OSError:
+                sizes.append(0) # 선택 후 삭제되었거나 읽을 수 없는 파일 (실제 작업에서 오류로 보고됨)
+        total_bytes = sum(sizes)
+        step = max(1, len(paths) // PLANNER_SAMPLE_FILES)
+        sampled_bytes = sampled_pages = checked_pages = images = 0
+        for index in range(0, len(paths), step)[:PLANNER_SAMPLE_FILES]:
+            try:
+                with fitz.open(paths[index]) as doc:
+                    sampled_pages += doc.page_count
+                    sampled_bytes += sizes[index]
+                    for page_index in range(min(PLANNER_SAMPLE_PAGES, doc.page_count)):
+                        images += len(doc[page_index].get_images())
+                        checked_pages += 1
+            except Exception:
+                continue # 열 수 없는 파일은 추정에서 제외 (실제 작업에서 오류로 보고됨)
+
+        if sampled_bytes:
+            total_pages = round(sampled_pages * total_bytes / sampled_bytes)
+        else:
+            total_pages = sampled_pages
+        return {
+            "files": len(paths),
+            "pages": max(total_pages, sampled_pages),
+            "size_mb": total_bytes / (1024 * 1024),
+            "images_per_page": images / checked_pages if checked_pages else 0.0,
+        }
+
+    def plan(self, kind, paths, scale=1.0, max_workers=None):
+        """
+        작업 종류(merge, preview, text, images)에 맞는 실행 계획을 만듭니다.
+        scale은 페이지당 비용 배율입니다 (예: 렌더링 해상도에 따른 픽셀 수 비율).
+        max_workers는 메모리 등 다른 이유로 제한해야 하는 최대 워커 수입니다.
+        """
+        plan = self.sample_inputs(paths)
+        plan["kind"] = kind
+        costs = DEFAULT_JOB_COSTS[kind]
+        factor = self.history.get(kind, {}).get("factor", 1.0)
+        pages = plan["pages"]
+        serial_seconds = factor * (
+            pages * costs["page"] * scale
+            + plan["size_mb"] * costs["mb"]
+            + pages * plan["images_per_page"] * costs["image"] * scale
+        )
+        mb_per_page = plan["size_mb"] / pages if pages else 0.0
+
+        # 병렬화: 추정 시간이 짧거나 페이지가 적으면 현재 프로세스에서 처리
+        workers = 1
+        if kind in ("text", "images") and serial_seconds > IN_PROCESS_MAX_SECONDS and pages > 1:
+            workers = max(1, min(os.cpu_count() or 1, pages))
+        elif kind == "preview":
+            workers = max(1, min(PREVIEW_RENDER_WORKERS, pages)) # 미리보기는 항상 렌더링 프로세스에서 처리
+        if max_workers:
+            workers = min(workers, max_workers)
+        plan["workers"] = workers
+        plan["chunk_pages"] = max(8, min(256, math.ceil(pages / (workers * 4)))) if pages else TEXT_EXPORT_CHUNK_PAGES
+        # 보정 계수와 무관한 고정 비용 (미리보기 렌더링 프로세스는 한 번 띄우면 계속 재사용)
+        plan["overhead"] = POOL_STARTUP_SECONDS if workers > 1 and kind != "preview" else 0.0
+        plan["estimate"] = serial_seconds / workers + plan["overhead"]
+
+        # 합치기 엔진: 스캔본처럼 페이지당 용량이 크거나 전체 용량이 크면 PyMuPDF가 훨씬 빠름
+        # (PyMuPDF로 합칠 때도 각 파일의 북마크를 페이지 위치에 맞춰 다시 만들어 PyPDF2와 결과를 맞춤)
+        plan["engine"] = "pymupdf" if mb_per_page > 0.5 or plan["size_mb"] > 200 else "pypdf2"
+
+        # 미리보기 배율: 페이지가 많거나 이미지가 많은 문서는 해상도를 낮춰 메모리와 렌더링 시간 절약
+        if pages > 1000:
+            plan["preview_zoom"] = 0.3
+        elif pages > 200 or plan["images_per_page"] > 1 or mb_per_page > 0.5:
+            plan["preview_zoom"] = 0.5
+        else:
+            plan["preview_zoom"] = PREVIEW_ZOOM
+        return plan
+
+    def record(self, plan, elapsed):
+        """실제 소요 시간으로 보정 계수를 갱신하고, 추정치와 비교한 문자열을 반환합니다."""
+        # 프로세스 풀 시작 같은 고정 비용은 빼고, 페이지/용량에 비례하는 부분만 비교
+        estimated_work = plan["estimate"] - plan["overhead"]
+        actual_work = elapsed - plan["overhead"]
+        if estimated_work > 0 and actual_work > 0:
+            entry = self.history.setdefault(plan["kind"], {"factor": 1.0, "runs": 0})
+            # 로그 공간 지수 이동 평균으로 천천히 보정하고, 비율을 제한해 한 번의 이상치
+            # (디스크 캐시가 비어 있던 실행 등)로 계수가 크게 흔들리지 않게 함 (한 번에 최대 약 1.5배)
+            ratio = min(4.0, max(0.25, actual_work / estimated_work))
+            entry["factor"] = min(20.0, max(0.05, entry["factor"] * ratio ** 0.3))
+            entry["runs"] += 1
+            _save_app_data(ESTIMATOR_HISTORY_PATH, self.history)
+        return f"예상 {plan['estimate']:.1f}초 / 실제 {elapsed:.1f}초"
+
+    @staticmethod
+    def describe(plan):
+        """실행 계획을 사용자에게 보여줄 한 줄 문자열로 만듭니다."""
+        return " | ".join(JobPlanner.describe_lines(plan))
+
+    @staticmethod
+    def describe_lines(plan):
+        """실행 계획 설명을 항목(예상 시간, 입력 규모, 실행 전략)별 줄 목록으로 만듭니다."""
+        if plan["workers"] > 1:
+            strategy = f"프로세스 풀 {plan['workers']}개 워커"
+        else:
+            strategy = "현재 프로세스"
+        details = {
+            "merge": f"엔진 {'PyMuPDF (북마크 재구성)' if plan['engine'] == 'pymupdf' else 'PyPDF2'}",
+            "preview": f"미리보기 {round(plan['preview_zoom'] * 72)} DPI",
+            "text": f"묶음 {plan['chunk_pages']}페이지",
+            "images": "페이지 단위 작업",
+        }[plan["kind"]]
+        return [
+            f"예상 소요 시간 약 {plan['estimate']:.1f}초",
+            f"파일 {plan['files']}개, 약 {plan['pages']}페이지, "
+            f"{plan['size_mb']:.1f} MB, 페이지당 이미지 {plan['images_per_page']:.1f}개",
+            f"{strategy}, {details}",
+        ]
+
+
+class DocumentPreview(QScrollArea):
+    """
+    문서 하나의 페이지 미리보기 영역입니다. 탭마다 하나씩 만들어 두고, 탭을 전환하면 다시 만들지 않고 그대로 표시합니다.
+    렌더링 전에는 페이지 크기만큼의 빈 라벨을 자리 표시자로 둡니다.
+    """
+    def __init__(self, doc, zoom):
+        super().__init__()
+        self.setWidgetResizable(True)
+        self.setFrameShape(QFrame.Shape.StyledPanel)
+        contents_widget = QWidget()
+        layout = QVBoxLayout(contents_widget)
+        layout.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignHCenter)
+        self.page_labels = [] # 페이지 이미지 라벨
+
+        for i in range(doc.page_count):
+            # QLabel에 페이지 번호와 이미지(렌더링 전에는 자리 표시자) 표시
+            page_label = QLabel(f"Page {i + 1}")
+            page_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            page_label.setStyleSheet("font-weight: bold; margin-top: 5px;")
+            image_label = QLabel()
+            image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            image_label.setFrameShape(QFrame.Shape.StyledPanel) # 프레임 추가
+            # 페이지 객체를 읽지 않고 크기만 조회 (렌더링 전에도 스크롤 위치가 맞도록 자리 확보)
+            rect = doc.page_cropbox(i)
+            image_label.setFixedSize(int(rect.width * zoom), int(rect.height * zoom))
+
+            layout.addWidget(page_label)
+            layout.addWidget(image_label)
+            layout.addSpacing(10)
+            self.page_labels.append(image_label)
+
+        self.setWidget(contents_widget)
+
+    def set_page_pixmap(self, page_index, pixmap):
+        """페이지 이미지를 표시합니다. pixmap이 None이면 렌더링 오류로 표시합니다."""
+        if page_index >= len(self.page_labels):
+            return
+        image_label = self.page_labels[page_index]
+        if pixmap is None:
+            image_label.setText("렌더링 오류")
+        else:
+            image_label.setPixmap(pixmap)
+            image_label.setFixedSize(pixmap.size()) # 이미지 크기에 맞춰 라벨 크기 고정
+
 
 class PDFEditorApp(QWidget):
+    # 렌더링 프로세스의 결과를 GUI 스레드로 전달 (future 콜백은 다른 스레드에서 호출됨)
+    page_rendered = pyqtSignal(object)
+
     def __init__(self):
         super().__init__()
         self.current_pdf_path = None # 현재 작업 중인 PDF 파일 경로
-        self.current_pdf_doc = None # PyMuPDF Document 객체
+        self.current_pdf_doc = None # PyMuPDF Document 객체 (doc_pool이 소유)
+        self.doc_pool = DocumentPool() # 작업 공간에 열린 문서 핸들 풀
+        self.preview_cache = OrderedDict() # 경로 -> {페이지 인덱스: QPixmap, 렌더링 실패 시 None} (오래된 순)
+        self.preview_signatures = {} # 경로 -> 캐시를 만들 때의 파일 시그니처
+        self.preview_cache_lru = OrderedDict() # (경로, 페이지 인덱스) -> 이미지 바이트 수 (오래된 순)
+        self.preview_cache_bytes = 0 # 캐시된 미리보기 이미지의 총 바이트 수
+        self.render_window = (0, -1) # 현재 탭에서 렌더링해 둘 페이지 범위 (시작, 끝)
+        self.preview_loading = False # 현재 탭의 렌더링 범위를 채우는 중인지 여부
+        self.preview_views = {} # 경로 -> DocumentPreview (탭마다 하나)
+        self.page_image_labels = [] # 현재 탭의 페이지 이미지 라벨
+        self.render_queue = [] # (우선순위, 순번, 경로, 페이지 인덱스) 힙
+        self.render_in_flight = set() # 렌더링 프로세스에 보낸 (경로, 페이지 인덱스)
+        self.render_executor = None # 미리보기 렌더링 프로세스 풀 (처음 필요할 때 생성)
+        self.page_rendered.connect(self._on_page_rendered)
+        self.preview_zoom = {} # 경로 -> 실행 계획에서 정한 미리보기 배율
+        self.preview_plan = None # 진행 중인 미리보기의 (경로, 실행 계획, 시작 시각)
+        self.planner = JobPlanner()
         self.initUI()
 
     def initUI(self):
@@ -59,12 +637,14 @@ class PDFEditorApp(QWidget):
         self.btn_unlock = QPushButton("암호 해제")
         self.btn_add_cover = QPushButton("표지 추가")
         self.btn_extract_text = QPushButton("텍스트 추출")
+        self.btn_inventory = QPushButton("폴더 PDF 목록 검사")
+        self.btn_export_images = QPushButton("페이지 이미지로 내보내기")
 
         # 버튼 스타일 및 크기 정책 설정
         buttons = [
             self.btn_merge_files, self.btn_merge_folder, self.btn_extract,
             self.btn_delete_reorder, self.btn_unlock, self.btn_add_cover,
-            self.btn_extract_text
+            self.btn_extract_text, self.btn_inventory, self.btn_export_images
         ]
         for btn in buttons:
             btn.setMinimumHeight(60) # 버튼 높이 증가
@@ -94,7 +674,9 @@ class PDFEditorApp(QWidget):
         grid_layout.addWidget(self.btn_delete_reorder, 1, 1)
         grid_layout.addWidget(self.btn_unlock, 2, 0)
         grid_layout.addWidget(self.btn_add_cover, 2, 1)
-        grid_layout.addWidget(self.btn_extract_text, 3, 0, 1, 2) # 텍스트 추출 버튼은 두 컬럼에 걸쳐 배치
+        grid_layout.addWidget(self.btn_extract_text, 3, 0)
+        grid_layout.addWidget(self.btn_inventory, 3, 1)
+        grid_layout.addWidget(self.btn_export_images, 4, 0, 1, 2) # 이미지 내보내기 버튼은 두 컬럼에 걸쳐 배치
 
         main_menu_page.setLayout(grid_layout)
         self.stacked_widget.addWidget(main_menu_page) # 스택 위젯에 메인 메뉴 페이지 추가
@@ -107,22 +689,32 @@ class PDFEditorApp(QWidget):
         self.btn_unlock.clicked.connect(self.unlock_pdf)
         self.btn_add_cover.clicked.connect(self.add_cover)
         self.btn_extract_text.clicked.connect(self.extract_text)
+        self.btn_inventory.clicked.connect(self.inventory_pdf_folder)
+        self.btn_export_images.clicked.connect(self.export_page_images)
 
     def _setup_operation_page(self):
         """페이지 미리보기 및 작업 화면을 설정합니다."""
         self.operation_page = QWidget()
         main_h_layout = QHBoxLayout()
 
-        # 왼쪽: PDF 페이지 미리보기 영역 (스크롤 가능)
+        # 왼쪽: 문서 탭과 PDF 페이지 미리보기 영역 (스크롤 가능)
         left_layout = QVBoxLayout()
-        self.preview_scroll_area = QScrollArea()
-        self.preview_scroll_area.setWidgetResizable(True)
-        self.preview_scroll_area.setFrameShape(QFrame.Shape.StyledPanel)
-        self.preview_contents_widget = QWidget()
-        self.preview_layout = QVBoxLayout(self.preview_contents_widget)
-        self.preview_layout.setAlignment(Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignHCenter)
-        self.preview_scroll_area.setWidget(self.preview_contents_widget)
-        left_layout.addWidget(self.preview_scroll_area)
+        tab_h_layout = QHBoxLayout()
+        self.document_tabs = QTabBar()
+        self.document_tabs.setTabsClosable(True)
+        self.document_tabs.setMovable(True)
+        self.document_tabs.setExpanding(False)
+        self.document_tabs.currentChanged.connect(self._on_document_tab_changed)
+        self.document_tabs.tabCloseRequested.connect(self._close_document_tab)
+        tab_h_layout.addWidget(self.document_tabs, 1)
+        self.add_document_button = QPushButton("파일 추가")
+        self.add_document_button.clicked.connect(self._add_documents_to_workspace)
+        tab_h_layout.addWidget(self.add_document_button)
+        left_layout.addLayout(tab_h_layout)
+
+        # 탭마다 만들어 둔 미리보기 영역(DocumentPreview)을 쌓아 두고 현재 탭의 것만 표시
+        self.preview_stack = QStackedWidget()
+        left_layout.addWidget(self.preview_stack)
 
         # 미리보기 로딩 진행률 바
         self.preview_progress_bar = QProgressBar(self)
@@ -201,75 +793,337 @@ class PDFEditorApp(QWidget):
         self.stacked_widget.addWidget(self.operation_page) # 스택 위젯에 작업 페이지 추가
 
     def _go_to_main_menu(self):
-        """메인 메뉴 화면으로 돌아갑니다."""
+        """메인 메뉴 화면으로 돌아갑니다. 열린 문서 탭과 미리보기는 작업 공간에 유지됩니다."""
         self.stacked_widget.setCurrentIndex(0)
-        # 작업 후 상태 초기화
+        # 작업 후 상태 초기화 (문서 핸들은 doc_pool이 관리하므로 닫지 않음)
         self.current_pdf_path = None
-        if self.current_pdf_doc:
-            self.current_pdf_doc.close()
-            self.current_pdf_doc = None
-        self._clear_preview()
+        self.current_pdf_doc = None
+        self.page_image_labels = []
+        self.render_queue = []
+        self.render_window = (0, -1)
+        self.preview_loading = False
         self.input_line_edit.clear()
         self.current_file_label.setText("선택된 파일: 없음")
         self.status_bar.showMessage("준비 완료")
         self.preview_progress_bar.hide()
 
-
-    def _clear_preview(self):
-        """미리보기 영역의 모든 페이지 이미지를 제거합니다."""
-        while self.preview_layout.count():
-            item = self.preview_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
+    def closeEvent(self, event):
+        """창을 닫을 때 렌더링 프로세스와 열린 모든 문서 핸들을 정리합니다."""
+        self.render_queue = []
+        if self.render_executor is not None:
+            self.render_executor.shutdown(cancel_futures=True) # 처리 중인 몇 페이지만 기다림
+            self.render_executor = None
+        self.doc_pool.close_all()
+        super().closeEvent(event)
 
     def _load_and_display_pdf_preview(self, pdf_path):
         """
-        주어진 PDF 파일의 페이지들을 미리보기 영역에 표시합니다.
+        주어진 PDF 파일을 작업 공간 탭으로 열고 미리보기 영역에 표시합니다.
+        이미 열려 있는 파일이면 해당 탭으로 전환합니다.
         """
-        self._clear_preview() # 기존 미리보기 지우기
-        self.current_file_label.setText(f"선택된 파일: {os.path.basename(pdf_path)}")
-        self.preview_progress_bar.show()
-        self.status_bar.showMessage("페이지 미리보기 로딩 중...")
+        for index in range(self.document_tabs.count()):
+            if self.document_tabs.tabData(index) == pdf_path:
+                if index == self.document_tabs.currentIndex():
+                    self._show_document(pdf_path)
+                else:
+                    self.document_tabs.setCurrentIndex(index) # _on_document_tab_changed에서 표시
+                return
 
-        try:
-            self.current_pdf_doc = fitz.open(pdf_path) # PyMuPDF Document 열기
-            total_pages = len(self.current_pdf_doc)
-            self.preview_progress_bar.setMaximum(total_pages)
+        index = self.document_tabs.addTab(os.path.basename(pdf_path))
+        self.document_tabs.setTabData(index, pdf_path)
+        self.document_tabs.setTabToolTip(index, pdf_path)
+        if index == self.document_tabs.currentIndex():
+            self._show_document(pdf_path) # 첫 탭은 currentChanged가 발생하기 전에 이미 선택됨
+        else:
+            self.document_tabs.setCurrentIndex(index)
 
-            for i, page in enumerate(self.current_pdf_doc):
-                # 페이지를 픽스맵으로 렌더링 (해상도 조절 가능)
-                # 높은 해상도는 메모리 사용량과 로딩 시간을 증가시킬 수 있습니다.
-                pix = page.get_pixmap(matrix=fitz.Matrix(0.8, 0.8)) # 미리보기 크기 조절
+    def _add_documents_to_workspace(self):
+        """작업 공간에 PDF 파일을 추가로 엽니다."""
+        file_paths, _ = QFileDialog.getOpenFileNames(
+            self, "작업 공간에 추가할 PDF 파일 선택", "", "PDF 파일 (*.pdf);;모든 파일 (*)"
+        )
+        for file_path in file_paths:
+            self._load_and_display_pdf_preview(file_path)
 
-                # QImage로 변환
-                img = QImage(pix.samples, pix.width, pix.height, pix.stride, QImage.Format.Format_RGB888)
-                pixmap = QPixmap.fromImage(img)
+    def _on_document_tab_changed(self, index):
+        """탭이 전환되면 해당 문서를 현재 작업 대상으로 표시합니다."""
+        if index < 0:
+            return
+        pdf_path = self.document_tabs.tabData(index)
+        if pdf_path:
+            self._show_document(pdf_path)
+
+    def _close_document_tab(self, index):
+        """문서 탭을 닫고 해당 문서 핸들과 렌더링 캐시를 해제합니다."""
+        pdf_path = self.document_tabs.tabData(index)
+        self.document_tabs.removeTab(index)
+        self.doc_pool.release(pdf_path)
+        self._drop_preview_cache(pdf_path)
+        if pdf_path == self.current_pdf_path and self.document_tabs.count() == 0:
+            self._go_to_main_menu()
+        else:
+            self._schedule_preview_render()
 
-                # QLabel에 페이지 번호와 이미지 표시
-                page_label = QLabel(f"Page {i + 1}")
-                page_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                page_label.setStyleSheet("font-weight: bold; margin-top: 5px;")
-                image_label = QLabel()
-                image_label.setPixmap(pixmap)
-                image_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-                image_label.setFixedSize(pixmap.size()) # 이미지 크기에 맞춰 라벨 크기 고정
-                image_label.setFrameShape(QFrame.Shape.StyledPanel) # 프레임 추가
+    def _show_document(self, pdf_path):
+        """
+        문서의 미리보기 영역을 표시합니다. 이미 만들어 둔 탭이면 그대로 다시 보여주고,
+        처음 여는 문서면 자리 표시자로 미리보기 영역을 만든 뒤 렌더링을 예약합니다.
+        """
+        self.current_pdf_path = pdf_path
+        self.current_file_label.setText(f"선택된 파일: {os.path.basename(pdf_path)}")
 
-                # 미리보기 레이아웃에 추가
-                self.preview_layout.addWidget(page_label)
-                self.preview_layout.addWidget(image_label)
-                self.preview_layout.addSpacing(10)
+        try:
+            self.current_pdf_doc = self.doc_pool.get(pdf_path) # 풀에 있으면 다시 열지 않음
+        except Exception as e:
+            QMessageBox.critical(self, "미리보기 오류", f"PDF 미리보기를 로드하는 중 오류가 발생했습니다: {e}")
+            for index in range(self.document_tabs.count()):
+                if self.document_tabs.tabData(index) == pdf_path:
+                    self._close_document_tab(index) # 탭이 남지 않으면 메인 메뉴로 돌아감
+                    break
+            return
 
-                self.preview_progress_bar.setValue(i + 1) # 진행률 업데이트
-                QApplication.processEvents() # UI 업데이트를 위한 이벤트 처리
+        if self.preview_signatures.get(pdf_path) != self.doc_pool.signature(pdf_path):
+            self._drop_preview_cache(pdf_path) # 파일이 바뀌었으면 이전 미리보기는 버림
+        self.preview_signatures[pdf_path] = self.doc_pool.signature(pdf_path)
+        self._get_preview_cache(pdf_path)
+
+        self.preview_plan = None
+        plan_message = ""
+        view = self.preview_views.get(pdf_path)
+        if view is None:
+            # 처음 여는 문서는 크기와 이미지 밀도를 보고 미리보기 해상도를 정함
+            # 처음에는 맨 앞의 렌더링 범위만 그리므로 그 페이지 비율만큼만 비용을 추정
+            total_pages = len(self.current_pdf_doc)
+            window_pages = min(total_pages, 2 * PREVIEW_WINDOW_PAGES + 1)
+            try:
+                plan = self.planner.plan("preview", [pdf_path], scale=window_pages / total_pages if total_pages else 1.0)
+            except Exception:
+                plan = None # 추정에 실패해도 기본 배율로 미리보기는 계속
+            if plan:
+                self.preview_zoom[pdf_path] = plan["preview_zoom"]
+                self.preview_plan = (pdf_path, plan, time.perf_counter())
+                plan_message = f" ({JobPlanner.describe(plan)})"
+
+            view = DocumentPreview(self.current_pdf_doc, self.preview_zoom.get(pdf_path, PREVIEW_ZOOM))
+            # 스크롤 시 화면에 보이는 페이지부터 렌더링하도록 우선순위 재계산
+            view.verticalScrollBar().valueChanged.connect(self._schedule_preview_render)
+            self.preview_views[pdf_path] = view
+            self.preview_stack.addWidget(view)
+
+        self.preview_stack.setCurrentWidget(view)
+        self.page_image_labels = view.page_labels
+
+        self.preview_loading = True
+        self._schedule_preview_render() # 렌더링 범위가 이미 캐시되어 있으면 바로 완료 메시지 표시
+        if self.preview_loading:
+            self.status_bar.showMessage(f"페이지 미리보기 로딩 중...{plan_message}")
+
+    def _drop_preview_cache(self, pdf_path):
+        """문서의 렌더링 캐시, 미리보기 영역, 미리보기 배율을 제거합니다."""
+        for page_index in self.preview_cache.pop(pdf_path, {}):
+            self.preview_cache_bytes -= self.preview_cache_lru.pop((pdf_path, page_index), 0)
+        self.preview_signatures.pop(pdf_path, None)
+        self.preview_zoom.pop(pdf_path, None)
+        view = self.preview_views.pop(pdf_path, None)
+        if view is not None:
+            self.preview_stack.removeWidget(view)
+            view.deleteLater()
+            if pdf_path == self.current_pdf_path:
+                self.page_image_labels = []
+
+    def _get_preview_cache(self, pdf_path):
+        """문서의 렌더링 캐시(페이지 인덱스 -> QPixmap)를 반환합니다."""
+        page_cache = self.preview_cache.setdefault(pdf_path, {})
+        self.preview_cache.move_to_end(pdf_path)
+        return page_cache
+
+    def _store_preview_page(self, pdf_path, page_index, pixmap):
+        """렌더링된 페이지를 캐시에 넣고, 전체 용량이 PREVIEW_CACHE_MAX_BYTES를 넘으면 오래된 페이지부터 버립니다."""
+        self.preview_cache[pdf_path][page_index] = pixmap
+        if pixmap is None:
+            return # 렌더링 실패 표시는 메모리를 쓰지 않으므로 제거 대상에서 제외
+        size = pixmap.width() * pixmap.height() * pixmap.depth() // 8
+        self.preview_cache_lru[(pdf_path, page_index)] = size
+        self.preview_cache_bytes += size
+        if self.preview_cache_bytes <= PREVIEW_CACHE_MAX_BYTES:
+            return
 
-            self.status_bar.showMessage(f"{total_pages} 페이지 미리보기 로딩 완료.")
+        first, last = self.render_window
+        for key in list(self.preview_cache_lru):
+            if self.preview_cache_bytes <= PREVIEW_CACHE_MAX_BYTES:
+                break
+            path, index = key
+            if path == self.current_pdf_path and first <= index <= last:
+                continue # 현재 보고 있는 범위는 유지
+            self.preview_cache_bytes -= self.preview_cache_lru.pop(key)
+            self.preview_cache[path].pop(index, None)
+            view = self.preview_views.get(path)
+            if view is not None and index < len(view.page_labels):
+                view.page_labels[index].clear() # 라벨이 QPixmap을 계속 잡고 있지 않도록 비움
+
+    def _visible_page_range(self):
+        """현재 스크롤 영역에 보이는 페이지 인덱스 범위(시작, 끝)를 반환합니다."""
+        view = self.preview_views.get(self.current_pdf_path)
+        if view is None or not self.page_image_labels:
+            return 0, -1
+        top = view.verticalScrollBar().value()
+        bottom = top + view.viewport().height()
+        first, last = None, None
+        for i, label in enumerate(self.page_image_labels):
+            if label.y() + label.height() < top:
+                continue
+            if label.y() > bottom:
+                break
+            if first is None:
+                first = i
+            last = i
+        if first is None:
+            return 0, 0
+        # 레이아웃이 잡히기 전에는 모든 라벨의 y가 0이므로 보이는 범위를 제한
+        return first, min(last, first + PREVIEW_WINDOW_PAGES)
+
+    def _schedule_preview_render(self):
+        """
+        렌더링 대기열을 우선순위에 따라 다시 만듭니다.
+        현재 탭의 보이는 페이지 -> 앞뒤 PREVIEW_WINDOW_PAGES 범위의 가까운 페이지 -> 다른 탭의 앞쪽 페이지 순입니다.
+        범위 밖의 페이지는 렌더링하지 않으므로 문서가 커도 메모리 사용량이 일정합니다.
+        """
+        queue = []
+        order = 0
+        if self.current_pdf_path and self.current_pdf_path in self.doc_pool:
+            page_cache = self.preview_cache.get(self.current_pdf_path, {})
+            first, last = self._visible_page_range()
+            self.render_window = (
+                max(0, first - PREVIEW_WINDOW_PAGES),
+                min(len(self.page_image_labels) - 1, last + PREVIEW_WINDOW_PAGES),
+            )
+            for i in range(self.render_window[0], self.render_window[1] + 1):
+                if i in page_cache:
+                    if page_cache[i] is not None:
+                        self.preview_cache_lru.move_to_end((self.current_pdf_path, i)) # 최근 사용으로 표시
+                    continue
+                if first <= i <= last:
+                    priority = 0
+                else:
+                    priority = 1 + (first - i if i < first else i - last)
+                queue.append((priority, order, self.current_pdf_path, i))
+                order += 1
+            self._update_preview_progress()
+
+        # 비활성 탭은 풀에 열려 있는 문서만 앞쪽 몇 페이지를 미리 렌더링 (다시 열거나 캐시를 밀어내지 않음)
+        background_priority = len(self.page_image_labels) + 1
+        for index in range(self.document_tabs.count()):
+            pdf_path = self.document_tabs.tabData(index)
+            if pdf_path == self.current_pdf_path or pdf_path not in self.doc_pool:
+                continue
+            page_cache = self.preview_cache.get(pdf_path)
+            view = self.preview_views.get(pdf_path)
+            if page_cache is None or view is None:
+                continue
+            for i in range(min(BACKGROUND_PREFETCH_PAGES, len(view.page_labels))):
+                if i not in page_cache:
+                    queue.append((background_priority + i, order, pdf_path, i))
+                    order += 1
+
+        heapq.heapify(queue)
+        self.render_queue = queue
+        self._pump_render_queue()
+
+    def _pump_render_queue(self):
+        """
+        대기열에서 우선순위가 높은 페이지부터 렌더링 프로세스로 보냅니다.
+        처리 중인 페이지 수를 워커 수의 2배로 제한하여, 스크롤하면 새 우선순위가 바로 반영되게 합니다.
+        """
+        while self.render_queue and len(self.render_in_flight) < PREVIEW_RENDER_WORKERS * 2:
+            _, _, pdf_path, page_index = heapq.heappop(self.render_queue)
+            page_cache = self.preview_cache.get(pdf_path)
+            key = (pdf_path, page_index)
+            if page_cache is None or page_index in page_cache or key in self.render_in_flight:
+                continue # 탭이 닫혔거나 이미 렌더링(중)임
+            if pdf_path not in self.doc_pool:
+                continue
+            if self.render_executor is None:
+                self.render_executor = ProcessPoolExecutor(max_workers=PREVIEW_RENDER_WORKERS)
+            signature = self.preview_signatures.get(pdf_path)
+            task = (pdf_path, signature, page_index, self.preview_zoom.get(pdf_path, PREVIEW_ZOOM))
+            try:
+                future = self.render_executor.submit(_render_preview_page, task)
+            except BrokenProcessPool:
+                self.render_executor = None # 다음 페이지부터 새 프로세스 풀 사용
+                self._store_preview_page(pdf_path, page_index, None)
+                continue
+            self.render_in_flight.add(key)
+            future.add_done_callback(
+                lambda f, key=key, signature=signature: self._emit_page_rendered(key, signature, f)
+            )
+
+    def _emit_page_rendered(self, key, signature, future):
+        """렌더링 프로세스의 future 콜백(다른 스레드)에서 GUI 스레드로 결과를 넘깁니다."""
+        try:
+            self.page_rendered.emit((key, signature, future))
+        except RuntimeError:
+            pass # 창이 이미 닫힘
+
+    def _on_page_rendered(self, result):
+        """렌더링된 페이지를 캐시에 넣고 해당 탭의 미리보기에 표시한 뒤, 다음 페이지를 보냅니다."""
+        (pdf_path, page_index), signature, future = result
+        self.render_in_flight.discard((pdf_path, page_index))
+        if future.cancelled():
+            return
+        page_cache = self.preview_cache.get(pdf_path)
+        if page_cache is not None and signature == self.preview_signatures.get(pdf_path):
+            try:
+                result = future.result()
+                if result is None:
+                    # 렌더링 도중 파일이 바뀜: 현재 탭이면 새 내용으로 다시 표시하고, 아니면 미리보기만 버림
+                    if pdf_path == self.current_pdf_path:
+                        self._show_document(pdf_path)
+                    else:
+                        self._drop_preview_cache(pdf_path)
+                        self._pump_render_queue()
+                    return
+                width, height, stride, samples = result
+                # QImage로 변환 (fromImage가 데이터를 복사하므로 samples 해제 후에도 안전)
+                img = QImage(samples, width, height, stride, QImage.Format.Format_RGB888)
+                pixmap = QPixmap.fromImage(img)
+            except Exception as e:
+                # 실패한 페이지도 완료로 기록하여 다시 대기열에 들어가거나 진행률이 멈추지 않게 함
+                if isinstance(e, BrokenProcessPool):
+                    self.render_executor = None
+                self.status_bar.showMessage(f"페이지 {page_index + 1} 렌더링 오류: {e}")
+                pixmap = None
+            self._store_preview_page(pdf_path, page_index, pixmap)
+            view = self.preview_views.get(pdf_path)
+            if view is not None:
+                view.set_page_pixmap(page_index, pixmap)
+            if pdf_path == self.current_pdf_path:
+                self._update_preview_progress() # 진행률 업데이트
+        self._pump_render_queue()
+
+    def _update_preview_progress(self):
+        """현재 탭의 렌더링 범위 진행률을 갱신하고, 범위를 모두 렌더링하면 완료 메시지를 표시합니다."""
+        first, last = self.render_window
+        page_cache = self.preview_cache.get(self.current_pdf_path, {})
+        total = max(0, last - first + 1)
+        done = sum(1 for i in range(first, last + 1) if i in page_cache)
+        self.preview_progress_bar.setMaximum(total)
+        self.preview_progress_bar.setValue(done)
+        if done < total:
+            self.preview_loading = True
+            self.preview_progress_bar.show()
+            return
 
-        except Exception as e:
-            QMessageBox.critical(self, "미리보기 오류", f"PDF 미리보기를 로드하는 중 오류가 발생했습니다: {e}")
-            self._go_to_main_menu() # 오류 발생 시 메인 메뉴로 돌아가기
-        finally:
-            self.preview_progress_bar.hide()
+        self.preview_progress_bar.hide()
+        if not self.preview_loading:
+            return
+        self.preview_loading = False
+        # 전체가 아니라 렌더링 범위만 채운 것이므로 범위를 함께 표시 (스크롤하면 다음 범위를 렌더링)
+        message = f"페이지 미리보기 로딩 완료: {first + 1}-{last + 1}/{len(self.page_image_labels)} 페이지."
+        if self.preview_plan and self.preview_plan[0] == self.current_pdf_path:
+            _, plan, start_time = self.preview_plan
+            self.preview_plan = None
+            message += f" ({self.planner.record(plan, time.perf_counter() - start_time)})"
+        self.status_bar.showMessage(message)
 
 
     # --- 각 기능별 메소드 ---
@@ -279,8 +1133,39 @@ class PDFEditorApp(QWidget):
         QMessageBox.information(self, "기능 준비 중", f"{feature_name} 기능은 현재 준비 중입니다.")
         self.status_bar.showMessage(f"{feature_name} 기능 준비 중...")
 
+    def _confirm_plan(self, plan, title):
+        """
+        실행 계획과 예상 소요 시간을 상태 바에 표시합니다.
+        예상 시간이 CONFIRM_MIN_SECONDS보다 길면 계속할지 묻고, 취소하면 False를 반환합니다.
+        """
+        self.status_bar.showMessage(JobPlanner.describe(plan))
+        QApplication.processEvents()
+        if plan["estimate"] < CONFIRM_MIN_SECONDS:
+            return True
+        description = "\n".join(JobPlanner.describe_lines(plan))
+        reply = QMessageBox.question(
+            self, title, f"시간이 오래 걸리는 작업입니다.\n\n{description}\n\n계속하시겠습니까?"
+        )
+        return reply == QMessageBox.StandardButton.Yes
+
+    def _plan_progress_text(self, plan, start_time, done, total):
+        """
+        진행 메시지 뒤에 붙일 실행 전략과 남은 시간 문자열을 만듭니다.
+        시작 직후에는 계획의 추정치를, 진행된 뒤에는 지금까지의 실제 속도를 기준으로 남은 시간을 계산합니다.
+        """
+        elapsed = time.perf_counter() - start_time
+        if done > 0:
+            remaining = elapsed / done * (total - done)
+        else:
+            remaining = max(0.0, plan["estimate"] - elapsed)
+        strategy = f"워커 {plan['workers']}개" if plan["workers"] > 1 else "현재 프로세스"
+        return f" | {strategy}, 예상 {plan['estimate']:.0f}초 중 약 {remaining:.0f}초 남음"
+
     def _merge_pdfs_logic(self, file_paths, save_path):
-        """실제 PDF 합치기 로직을 수행합니다."""
+        """
+        실제 PDF 합치기 로직을 수행합니다.
+        실행 계획에 따라 일반 파일은 PyPDF2로, 스캔본처럼 큰 파일은 PyMuPDF로 합칩니다.
+        """
         if not file_paths:
             return False, "합칠 파일이 없습니다."
         if len(file_paths) < 2:
@@ -288,21 +1173,49 @@ class PDFEditorApp(QWidget):
         if not save_path:
             return False, "저장 경로가 지정되지 않았습니다."
 
-        self.status_bar.showMessage("PDF 합치기 작업 시작...")
-        QApplication.processEvents()
-
         try:
-            pdf_merger = PdfMerger()
-            for i, file_path in enumerate(file_paths):
-                self.status_bar.showMessage(f"파일 추가 중: {os.path.basename(file_path)} ({i+1}/{len(file_paths)})")
-                QApplication.processEvents()
-                pdf_merger.append(file_path)
-
-            with open(save_path, 'wb') as output_pdf:
-                pdf_merger.write(output_pdf)
-            pdf_merger.close()
+            plan = self.planner.plan("merge", file_paths)
+            if not self._confirm_plan(plan, "PDF 합치기"):
+                return False, None # 사용자가 취소함 (오류 메시지 없음)
+
+            start_time = time.perf_counter()
+            self.status_bar.showMessage(f"PDF 합치기 작업 시작...{self._plan_progress_text(plan, start_time, 0, len(file_paths))}")
+            QApplication.processEvents()
+
+            if plan["engine"] == "pymupdf":
+                with fitz.open() as merged_doc:
+                    merged_toc = []
+                    for i, file_path in enumerate(file_paths):
+                        self.status_bar.showMessage(
+                            f"파일 추가 중: {os.path.basename(file_path)} ({i+1}/{len(file_paths)})"
+                            f"{self._plan_progress_text(plan, start_time, i, len(file_paths))}"
+                        )
+                        QApplication.processEvents()
+                        with fitz.open(file_path) as source_doc:
+                            # insert_pdf는 북마크를 옮기지 않으므로, PdfMerger처럼 각 파일의 목차를 페이지를 밀어서 이어 붙임
+                            page_offset = merged_doc.page_count
+                            for level, title, page in source_doc.get_toc(simple=True):
+                                merged_toc.append([level, title, page + page_offset if page > 0 else page])
+                            merged_doc.insert_pdf(source_doc)
+                    if merged_toc:
+                        merged_doc.set_toc(merged_toc)
+                    merged_doc.save(save_path, garbage=1, deflate=True)
+            else:
+                pdf_merger = PdfMerger()
+                for i, file_path in enumerate(file_paths):
+                    self.status_bar.showMessage(
+                        f"파일 추가 중: {os.path.basename(file_path)} ({i+1}/{len(file_paths)})"
+                        f"{self._plan_progress_text(plan, start_time, i, len(file_paths))}"
+                    )
+                    QApplication.processEvents()
+                    pdf_merger.append(file_path)
+
+                with open(save_path, 'wb') as output_pdf:
+                    pdf_merger.write(output_pdf)
+                pdf_merger.close()
+            comparison = self.planner.record(plan, time.perf_counter() - start_time)
             self.status_bar.showMessage("PDF 합치기 완료.")
-            return True, "PDF 합치기가 완료되었습니다."
+            return True, f"PDF 합치기가 완료되었습니다.\n({comparison})"
         except Exception as e:
             self.status_bar.showMessage("PDF 합치기 오류 발생.")
             return False, f"PDF 합치기 중 오류가 발생했습니다: {e}"
@@ -330,7 +1243,7 @@ class PDFEditorApp(QWidget):
         success, message = self._merge_pdfs_logic(file_paths, save_path)
         if success:
             QMessageBox.information(self, "작업 완료", message)
-        else:
+        elif message:
             QMessageBox.critical(self, "오류 발생", message)
         self.status_bar.showMessage("준비 완료")
 
@@ -357,7 +1270,34 @@ class PDFEditorApp(QWidget):
             self.status_bar.showMessage("PDF 파일 없음.")
             return
 
-        self.status_bar.showMessage(f"{len(pdf_files)}개의 PDF 파일 발견. 합칠 파일 선택 중...")
+        # 합치기 전에 암호화되었거나 열 수 없는 파일을 메타데이터만으로 미리 확인
+        try:
+            records = self._scan_pdf_inventory(pdf_files)
+        except Exception as e:
+            QMessageBox.critical(self, "오류 발생", f"PDF 파일 검사 중 오류가 발생했습니다: {e}")
+            self.status_bar.showMessage("PDF 파일 검사 오류 발생.")
+            return
+        problem_records = [r for r in records if r["status"] in ("encrypted", "error")]
+        if problem_records:
+            names = "\n".join(
+                f"- {os.path.basename(r['path'])} ({'암호화됨' if r['status'] == 'encrypted' else '열 수 없음'})"
+                for r in problem_records[:10]
+            )
+            if len(problem_records) > 10:
+                names += f"\n... 외 {len(problem_records) - 10}개"
+            reply = QMessageBox.question(
+                self, "문제 파일 발견",
+                f"합칠 수 없는 PDF 파일 {len(problem_records)}개를 발견했습니다:\n{names}\n\n이 파일들을 제외하고 계속하시겠습니까?"
+            )
+            if reply != QMessageBox.StandardButton.Yes:
+                self.status_bar.showMessage("폴더 내 PDF 합치기 취소됨.")
+                return
+            problem_paths = {r["path"] for r in problem_records}
+            pdf_files = [path for path in pdf_files if path not in problem_paths]
+
+        merge_paths = set(pdf_files)
+        total_pages = sum(r["pages"] or 0 for r in records if r["path"] in merge_paths)
+        self.status_bar.showMessage(f"{len(pdf_files)}개의 PDF 파일 발견 (총 {total_pages} 페이지). 합칠 파일 선택 중...")
         QApplication.processEvents()
 
         # 합쳐진 파일을 저장할 위치 및 파일명 선택 다이얼로그
@@ -372,7 +1312,7 @@ class PDFEditorApp(QWidget):
         success, message = self._merge_pdfs_logic(pdf_files, save_path)
         if success:
             QMessageBox.information(self, "작업 완료", message)
-        else:
+        elif message:
             QMessageBox.critical(self, "오류 발생", message)
         self.status_bar.showMessage("준비 완료")
 
@@ -387,6 +1327,110 @@ class PDFEditorApp(QWidget):
                     pdf_files.append(os.path.join(root, file))
         return sorted(pdf_files) # 파일 순서를 위해 정렬
 
+    def _scan_pdf_inventory(self, pdf_files):
+        """
+        PDF 파일들의 메타데이터를 병렬로 검사하여 입력 순서대로 반환합니다.
+        수정 시각과 크기가 같은 파일은 캐시된 결과를 사용합니다.
+        """
+        cache = _load_app_data(INVENTORY_CACHE_PATH)
+        records = {}
+        to_scan = []
+        for path in pdf_files:
+            cached = cache.get(path)
+            try:
+                stat = os.stat(path)
+            except OSError as e:
+                records[path] = {
+                    "path": path, "size": None, "mtime": None, "pages": None, "version": "",
+                    "encrypted": False, "producer": "", "status": "error", "error": str(e),
+                }
+                continue
+            if cached and cached.get("mtime") == stat.st_mtime and cached.get("size") == stat.st_size:
+                records[path] = cached
+            else:
+                to_scan.append(path)
+
+        if to_scan:
+            chunks = [to_scan[i:i + INVENTORY_CHUNK_FILES] for i in range(0, len(to_scan), INVENTORY_CHUNK_FILES)]
+            # 파일이 적으면 프로세스 풀 시작 비용이 더 크므로 현재 프로세스에서 검사
+            workers = 1 if len(to_scan) <= INVENTORY_IN_PROCESS_FILES else min(os.cpu_count() or 1, len(chunks))
+            scanned = 0
+            try:
+                for chunk_records in _iter_scan_chunks(chunks, max_workers=workers):
+                    for record in chunk_records:
+                        records[record["path"]] = record
+                        cache[record["path"]] = record
+                    scanned += len(chunk_records)
+                    self.status_bar.showMessage(f"PDF 메타데이터 검사 중: {scanned}/{len(to_scan)} (캐시 사용 {len(pdf_files) - len(to_scan)}개)")
+                    QApplication.processEvents()
+            finally:
+                # 중간에 실패하거나 중단되어도 그때까지 검사한 결과는 캐시에 저장 (삭제된 파일의 항목은 남기지 않음)
+                cache = {
+                    path: record for path, record in cache.items()
+                    if record.get("mtime") is not None and os.path.exists(path)
+                }
+                _save_app_data(INVENTORY_CACHE_PATH, cache)
+
+        return [records[path] for path in pdf_files]
+
+    def inventory_pdf_folder(self):
+        """
+        폴더 및 하위 폴더의 모든 PDF 파일을 검사하여 페이지 수, 암호화 여부, PDF 버전, 크기, 생성 프로그램을
+        CSV 또는 JSON 보고서로 저장합니다.
+        """
+        folder_path = QFileDialog.getExistingDirectory(
+            self, "검사할 폴더 선택", ""
+        )
+
+        if not folder_path:
+            self.status_bar.showMessage("폴더 선택 취소됨.")
+            return
+
+        self.status_bar.showMessage(f"폴더 '{os.path.basename(folder_path)}'에서 PDF 파일 검색 중...")
+        QApplication.processEvents()
+
+        pdf_files = self._find_pdf_files_recursive(folder_path)
+
+        if not pdf_files:
+            QMessageBox.warning(self, "파일 없음", "선택한 폴더 및 하위 폴더에서 PDF 파일을 찾을 수 없습니다.")
+            self.status_bar.showMessage("PDF 파일 없음.")
+            return
+
+        save_path, selected_filter = QFileDialog.getSaveFileName(
+            self, "검사 보고서 저장", "pdf_inventory.csv", "CSV 파일 (*.csv);;JSON 파일 (*.json)"
+        )
+
+        if not save_path:
+            self.status_bar.showMessage("보고서 저장 취소됨.")
+            return
+        # 확장자 없이 입력하면 선택한 형식의 확장자를 붙임 (보고서 형식은 확장자로 결정됨)
+        if os.path.splitext(save_path)[1].lower() not in ('.csv', '.json'):
+            save_path += '.json' if selected_filter.startswith("JSON") else '.csv'
+
+        try:
+            start_time = time.perf_counter()
+            records = self._scan_pdf_inventory(pdf_files)
+            _write_inventory_report(records, save_path)
+            elapsed = time.perf_counter() - start_time
+
+            encrypted_count = sum(1 for r in records if r["status"] == "encrypted")
+            repaired_count = sum(1 for r in records if r["status"] == "repaired")
+            error_count = sum(1 for r in records if r["status"] == "error")
+            total_pages = sum(r["pages"] or 0 for r in records)
+            total_size_mb = sum(r["size"] or 0 for r in records) / (1024 * 1024)
+            QMessageBox.information(
+                self, "작업 완료",
+                f"PDF 파일 {len(records)}개 검사 완료 ({elapsed:.1f}초)\n"
+                f"총 {total_pages} 페이지, {total_size_mb:.1f} MB\n"
+                f"암호화됨: {encrypted_count}개, 손상(복구됨): {repaired_count}개, 열 수 없음: {error_count}개"
+            )
+            self.status_bar.showMessage("PDF 목록 검사 완료.")
+        except Exception as e:
+            QMessageBox.critical(self, "오류 발생", f"PDF 목록 검사 중 오류가 발생했습니다: {e}")
+            self.status_bar.showMessage("PDF 목록 검사 오류 발생.")
+        finally:
+            self.status_bar.showMessage("준비 완료")
+
     def _start_page_operation_extract(self):
         """페이지 추출 작업을 시작합니다 (파일 선택 및 미리보기 로드)."""
         source_path, _ = QFileDialog.getOpenFileName(
@@ -723,7 +1767,8 @@ class PDFEditorApp(QWidget):
 
     def extract_text(self):
         """
-        선택된 PDF 파일의 모든 텍스트를 추출하여 .txt 파일로 저장합니다.
+        선택된 PDF 파일의 텍스트를 추출하여 선택한 형식(txt, 페이지별/블록별 JSONL, Markdown)으로 저장합니다.
+        페이지 묶음 단위로 프로세스 풀에서 병렬 추출하고, 결과는 순서대로 파일에 바로 기록합니다.
         """
         source_path, _ = QFileDialog.getOpenFileName(
             self, "텍스트를 추출할 PDF 파일 선택", "", "PDF 파일 (*.pdf);;모든 파일 (*)"
@@ -733,8 +1778,17 @@ class PDFEditorApp(QWidget):
             self.status_bar.showMessage("텍스트 추출 취소됨.")
             return
 
+        format_names = [name for name, _, _, _ in TEXT_EXPORT_FORMATS]
+        format_name, ok = QInputDialog.getItem(
+            self, "추출 형식 선택", "텍스트 추출 형식을 선택하세요:", format_names, 0, False
+        )
+        if not ok:
+            self.status_bar.showMessage("텍스트 추출 취소됨.")
+            return
+        _, export_format, default_name, file_filter = TEXT_EXPORT_FORMATS[format_names.index(format_name)]
+
         save_path, _ = QFileDialog.getSaveFileName(
-            self, "텍스트 파일 저장", "extracted_text.txt", "텍스트 파일 (*.txt);;모든 파일 (*)"
+            self, "텍스트 파일 저장", default_name, file_filter
         )
 
         if not save_path:
@@ -744,24 +1798,152 @@ class PDFEditorApp(QWidget):
         self.status_bar.showMessage("텍스트 추출 작업 시작...")
         QApplication.processEvents()
 
+        temp_path = None
         try:
-            reader = PdfReader(source_path)
-            full_text = ""
-            total_pages = len(reader.pages)
-            for i, page in enumerate(reader.pages):
-                full_text += page.extract_text() + "\n" # 각 페이지 텍스트 추출
-                self.status_bar.showMessage(f"텍스트 추출 중: 페이지 {i+1}/{total_pages}")
-                QApplication.processEvents()
-
-
-            with open(save_path, 'w', encoding='utf-8') as output_txt:
-                output_txt.write(full_text)
+            plan = self.planner.plan("text", [source_path])
+            if not self._confirm_plan(plan, "텍스트 추출"):
+                self.status_bar.showMessage("텍스트 추출 취소됨.")
+                return
 
-            QMessageBox.information(self, "작업 완료", "텍스트 추출이 완료되었습니다.")
+            start_time = time.perf_counter()
+            with fitz.open(source_path) as doc:
+                total_pages = doc.page_count
+
+            chunk_pages = plan["chunk_pages"]
+            tasks = [
+                (source_path, start, min(start + chunk_pages, total_pages), export_format)
+                for start in range(0, total_pages, chunk_pages)
+            ]
+            # 같은 폴더의 임시 파일에 기록한 뒤 완료되면 교체 (중간에 실패해도 잘린 파일이 남지 않음)
+            temp_path = f"{save_path}.tmp"
+            with open(temp_path, 'w', encoding='utf-8') as output_file:
+                results = iter_pool_results(_extract_text_chunk, tasks, max_workers=plan["workers"])
+                for i, chunk_text in enumerate(results):
+                    output_file.write(chunk_text) # 완료된 묶음을 순서대로 바로 기록
+                    done_pages = min((i + 1) * chunk_pages, total_pages)
+                    self.status_bar.showMessage(
+                        f"텍스트 추출 중: 페이지 {done_pages}/{total_pages}"
+                        f"{self._plan_progress_text(plan, start_time, done_pages, total_pages)}"
+                    )
+                    QApplication.processEvents()
+            os.replace(temp_path, save_path)
+
+            comparison = self.planner.record(plan, time.perf_counter() - start_time)
+            QMessageBox.information(self, "작업 완료", f"텍스트 추출이 완료되었습니다.\n({comparison})")
             self.status_bar.showMessage("텍스트 추출 완료.")
         except Exception as e:
             QMessageBox.critical(self, "오류 발생", f"텍스트 추출 중 오류가 발생했습니다: {e}")
             self.status_bar.showMessage("텍스트 추출 오류 발생.")
+        finally:
+            if temp_path and os.path.exists(temp_path):
+                os.remove(temp_path) # 실패한 경우의 임시 파일 정리
+            self.status_bar.showMessage("준비 완료")
+
+    def export_page_images(self):
+        """
+        선택된 PDF 파일의 모든 페이지를 지정한 DPI(또는 고정 너비)의 PNG/JPEG/TIFF 이미지로 저장합니다.
+        워커 프로세스마다 문서를 한 번 열어 렌더링과 인코딩을 병렬로 수행하고, 결과는 바로 디스크에 기록합니다.
+        """
+        source_path, _ = QFileDialog.getOpenFileName(
+            self, "이미지로 내보낼 PDF 파일 선택", "", "PDF 파일 (*.pdf);;모든 파일 (*)"
+        )
+
+        if not source_path:
+            self.status_bar.showMessage("이미지 내보내기 취소됨.")
+            return
+
+        image_format, ok = QInputDialog.getItem(
+            self, "이미지 형식 선택", "저장할 이미지 형식을 선택하세요:", list(IMAGE_EXPORT_FORMATS), 0, False
+        )
+        if not ok:
+            self.status_bar.showMessage("이미지 내보내기 취소됨.")
+            return
+
+        dpi, ok = QInputDialog.getInt(self, "해상도 입력", "해상도(DPI)를 입력하세요:", 150, 36, 1200)
+        if not ok:
+            self.status_bar.showMessage("이미지 내보내기 취소됨.")
+            return
+
+        width, ok = QInputDialog.getInt(
+            self, "고정 너비 입력", "이미지 너비를 픽셀로 고정하려면 입력하세요 (0이면 DPI 사용):", 0, 0, 20000
+        )
+        if not ok:
+            self.status_bar.showMessage("이미지 내보내기 취소됨.")
+            return
+
+        grayscale = QMessageBox.question(
+            self, "색상 선택", "흑백(그레이스케일)으로 저장하시겠습니까?"
+        ) == QMessageBox.StandardButton.Yes
+
+        output_dir = QFileDialog.getExistingDirectory(
+            self, "이미지를 저장할 폴더 선택", ""
+        )
+
+        if not output_dir:
+            self.status_bar.showMessage("이미지 저장 취소됨.")
+            return
+
+        self.status_bar.showMessage("이미지 내보내기 작업 시작...")
+        QApplication.processEvents()
+
+        try:
+            with fitz.open(source_path) as doc:
+                total_pages = doc.page_count
+                first_rect = doc.page_cropbox(0) if total_pages else fitz.Rect(0, 0, 1, 1)
+
+            # 동시에 렌더링하는 페이지 수를 픽스맵 크기로 제한 (1200 DPI A4 RGB 한 장이 약 420MB)
+            # 인코딩 중 복사본이 하나 더 생기므로 픽스맵 크기의 2배로 계산
+            zoom = width / first_rect.width if width else dpi / 72
+            pixmap_bytes = first_rect.width * zoom * first_rect.height * zoom * (1 if grayscale else 3)
+            max_workers = max(1, int(IMAGE_EXPORT_MAX_PIXMAP_BYTES // (pixmap_bytes * 2)))
+
+            # 렌더링 비용은 픽셀 수에 비례하므로 150 DPI(고정 너비는 A4 150 DPI 너비 1240px) 기준 배율로 추정
+            scale = (width / 1240) ** 2 if width else (dpi / 150) ** 2
+            plan = self.planner.plan("images", [source_path], scale=scale, max_workers=max_workers)
+            if not self._confirm_plan(plan, "이미지 내보내기"):
+                self.status_bar.showMessage("이미지 내보내기 취소됨.")
+                return
+
+            base_name = os.path.splitext(os.path.basename(source_path))[0]
+            extension = IMAGE_EXPORT_FORMATS[image_format]
+            digits = len(str(total_pages))
+            tasks = [
+                (i, os.path.join(output_dir, f"{base_name}_p{i + 1:0{digits}d}.{extension}"),
+                 image_format, dpi, width, grayscale)
+                for i in range(total_pages)
+            ]
+
+            start_time = time.perf_counter()
+            total_bytes = 0
+            # 대기 중인 작업은 페이지 번호와 경로만 가지므로, 메모리는 워커 수(동시에 렌더링하는 페이지 수)로 제한됨
+            results = iter_pool_results(
+                _render_page_image, tasks, max_workers=plan["workers"],
+                initializer=_init_render_worker, initargs=(source_path,)
+            )
+            for done_pages, (_, file_size) in enumerate(results, start=1):
+                total_bytes += file_size
+                pages_per_sec = done_pages / max(time.perf_counter() - start_time, 1e-6)
+                self.status_bar.showMessage(
+                    f"이미지 저장 중: 페이지 {done_pages}/{total_pages} ({pages_per_sec:.1f} 페이지/초)"
+                    f"{self._plan_progress_text(plan, start_time, done_pages, total_pages)}"
+                )
+                QApplication.processEvents()
+
+            elapsed = time.perf_counter() - start_time
+            comparison = self.planner.record(plan, elapsed)
+            QMessageBox.information(
+                self, "작업 완료",
+                f"{total_pages}개 페이지를 {image_format} 이미지로 저장했습니다.\n"
+                f"소요 시간: {elapsed:.1f}초 ({total_pages / max(elapsed, 1e-6):.1f} 페이지/초), "
+                f"총 {total_bytes / (1024 * 1024):.1f} MB\n({comparison})"
+            )
+            self.status_bar.showMessage("이미지 내보내기 완료.")
+        except ImportError:
+            QMessageBox.critical(self, "오류 발생", "TIFF 저장에는 Pillow 라이브러리가 필요합니다. 'pip install Pillow'로 설치하세요.")
+            self.status_bar.showMessage("이미지 내보내기 오류 발생.")
+        except Exception as e:
+            QMessageBox.critical(self, "오류 발생", f"이미지 내보내기 중 오류가 발생했습니다: {e}")
+            self.status_bar.showMessage("이미지 내보내기 오류 발생.")
         finally:
             self.status_bar.showMessage("준비 완료")
 